@@ -6,8 +6,8 @@ The use case is as follows:
   into a `Polars` `Struct` (see [samples](/samples) in this repo for examples).
 * Read said JSON content, as plain text using `scan_csv()` for instance, or directly as
   JSON via `scan_ndjson()` and automagically unpack the nested content by processing the
-  schema (_spoiler: the plain text way is better suited for our needs in the current_
-  `Polars` _implementation_).
+  schema (_spoiler: both ways end up identical, the schema being dominant in both
+  cases_).
 
 A few extra points:
 
@@ -88,6 +88,7 @@ there to check if this is only fantasy. Running is convincing!
 Feel free to cherry-pick and extend the functionalities to your own use cases.
 """
 
+import functools
 import pathlib
 import re
 import sys
@@ -117,6 +118,49 @@ POLARS_DATATYPES: dict[str, pl.DataType] = {
     "string": pl.Utf8,
 }
 
+# usual spellings of the datatypes (to spare lowercasing them), see the `SchemaParser`
+_DATATYPES_SPELLINGS: dict[str, str] = {
+    spelling: k
+    for k in POLARS_DATATYPES
+    for spelling in (
+        k,
+        k.upper(),
+        k.capitalize(),
+        k.capitalize().replace("Uint", "UInt"),
+    )
+}
+
+# datatypes exploded when unpacking, see the `UnpackFrame.unpack()` method
+_LIST_DTYPES: tuple[type[pl.DataType], ...] = (pl.Array, pl.List)
+# datatype classes exploded or unnested when unpacking
+_NESTED_DTYPE_CLASSES: tuple[type[pl.DataType], ...] = (*_LIST_DTYPES, pl.Struct)
+# names of the nesting datatypes, and of the ones opening a new level, see the
+# `SchemaParser` object
+_NESTED_DTYPES: frozenset[str] = frozenset(("array", "list", "struct"))
+_PARENT_DTYPES: frozenset[str] = frozenset(("list", "struct"))
+# datatypes the json reader cannot deserialize to (read wider then cast), see the
+# `unpack_ndjson()` function
+_NDJSON_DTYPES: dict[type[pl.DataType], type[pl.DataType]] = {
+    pl.Int8: pl.Int64,
+    pl.Int16: pl.Int64,
+    pl.UInt8: pl.UInt64,
+    pl.UInt16: pl.UInt64,
+}
+
+# schema tokens, see the `SchemaParser.to_struct()` method
+_RE_TOKEN: re.Pattern[str] = re.compile(
+    r"(?P<renamed_attr_dtype>"
+    r"([A-Za-z0-9_]+)\s*=\s*([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+))"
+    r"|(?P<attr_dtype>([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+))"
+    r"|(?P<lone_dtype>[A-Za-z0-9]+)"
+    r"|(?P<opening_delimiter>[(\[{<])"
+    r"|(?P<closing_delimiter>[)\]}>])"
+    r"|(?P<separator>[,\n\s]+)",
+)
+
+# end of the unparsed content, see the `SchemaParser.format_error()` method
+_RE_ISSUE_END: re.Pattern[str] = re.compile(r"[()\[\]{}<>\n]")
+
 
 def infer_schema(path_data: str) -> str:
     """Lazily scan newline-delimited JSON data and print the `Polars`-inferred schema.
@@ -154,52 +198,41 @@ def infer_schema(path_data: str) -> str:
         Pretty-printed `Polars` JSON schema.
     """
 
-    # quick work
-    def _pprint(field: str, dtype: pl.DataType, indent: str = "") -> str:
-        """Recursively loop over the inferred schema and pretty print its structure.
+    # walk the inferred schema depth-first without recursing; closing delimiters are
+    # stacked as plain strings, to be output once all the children have been
+    stack: list[tuple[str, pl.DataType, str] | str] = [
+        (f"{field}: ", dtype, "")
+        for field, dtype in reversed(pl.scan_ndjson(path_data).schema.items())
+    ]
+    schema: list[str] = []
 
-        Parameters
-        ----------
-        field : str
-            Name of the current field, including `:` separator.
-        dtype : polars.DataType
-            Datatype of the current field; nested or not.
-        indent : str
-            String used to indent (a number of spaces?); defaults to empty string
-            (`""`).
+    while stack:
+        # closing delimiter
+        if isinstance(item := stack.pop(), str):
+            schema.append(item)
+            continue
 
-        Returns
-        -------
-        : str
-            Pretty-printed field name and datatype of the current field.
-        """
-        schema = ""
+        field, dtype, indent = item
 
         # nested datatype: Struct
-        if hasattr(dtype, "fields"):
-            schema += f"{indent}{field}{dtype.__class__.__name__}(\n"
-            for f, d in dtype.to_schema().items():
-                schema += _pprint(f"{f}: ", d, f"{indent}    ")
-            schema += f"{indent})\n"
+        if (fields := getattr(dtype, "fields", None)) is not None:
+            schema.append(f"{indent}{field}{dtype.__class__.__name__}(\n")
+            stack.append(f"{indent})\n")
+            stack.extend(
+                (f"{f.name}: ", f.dtype, f"{indent}    ") for f in reversed(fields)
+            )
 
         # nested datatypes: Array, List
         elif hasattr(dtype, "inner"):
-            schema += f"{indent}{field}{dtype.__class__.__name__}(\n"
-            schema += _pprint("", dtype.inner, f"{indent}    ")
-            schema += f"{indent})\n"
+            schema.append(f"{indent}{field}{dtype.__class__.__name__}(\n")
+            stack.append(f"{indent})\n")
+            stack.append(("", dtype.inner, f"{indent}    "))
 
         # non-nested datatypes
         else:
-            schema += f"{indent}{field}{dtype}\n"
+            schema.append(f"{indent}{field}{_dtype_name(dtype)}\n")
 
-        return schema
-
-    # generate the pretty-printed schema
-    schema = ""
-    for field, dtype in pl.scan_ndjson(path_data).schema.items():
-        schema += _pprint(f"{field}: ", dtype)
-
-    return schema.strip()
+    return "".join(schema).strip()
 
 
 def parse_schema(path_schema: str) -> pl.Struct:
@@ -214,12 +247,58 @@ def parse_schema(path_schema: str) -> pl.Struct:
     -------
     : polars.Struct
         JSON schema translated into `Polars` datatypes.
+
+    Notes
+    -----
+    Parsed schemas are cached given their plain text content, and the file is not read
+    again as long as its modification time and size are unchanged; the returned object
+    is shared between calls and should not be modified.
+    """
+    path = pathlib.Path(path_schema).resolve()
+    stat = path.stat()
+
+    return _parse_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_file(path: str, mtime_ns: int, size: int) -> "SchemaParser":
+    """Read, parse (and cache) a plain text JSON schema file.
+
+    Parameters
+    ----------
+    path : str
+        Resolved path to the plain text file describing the JSON schema.
+    mtime_ns : int
+        Modification time of the file, in nanoseconds; only part of the cache key.
+    size : int
+        Size of the file, in bytes; only part of the cache key.
+
+    Returns
+    -------
+    : SchemaParser
+        Schema parser object, after parsing.
     """
-    with pathlib.Path(path_schema).open() as f:
-        sp = SchemaParser(f.read())
-        sp.to_struct()
+    return _parse_source(pathlib.Path(path).read_text())
+
 
-        return sp
+@functools.lru_cache(maxsize=128)
+def _parse_source(source: str) -> "SchemaParser":
+    """Parse (and cache) a plain text JSON schema.
+
+    Parameters
+    ----------
+    source : str
+        JSON schema described in plain text, using `Polars` datatypes.
+
+    Returns
+    -------
+    : SchemaParser
+        Schema parser object, after parsing.
+    """
+    sp = SchemaParser(source)
+    sp.to_struct()
+
+    return sp
 
 
 def unpack_ndjson(path_schema: str, path_data: str) -> pl.LazyFrame:
@@ -244,21 +323,23 @@ def unpack_ndjson(path_schema: str, path_data: str) -> pl.LazyFrame:
     * Fields present in the JSON source but absent from the schema will be dropped.
     """
     s = parse_schema(path_schema)
+    schema = s.struct.to_schema()
+    readable = {c: _ndjson_dtype(d) for c, d in schema.items()}
 
-    # read as json and unpack the object
-    df = pl.scan_ndjson(path_data).json.unpack(s.struct)
+    # read as json (skipping the schema inference; missing fields are read as nulls)
+    df = pl.scan_ndjson(path_data, schema=readable)
 
-    # add missing columns
-    df = df.with_columns(
-        [
-            pl.lit(None).cast(d).alias(p)
-            for p, d in zip(s.json_paths.keys(), s.dtypes, strict=True)
-            if p not in df.columns
-        ],
-    )
+    # cast back the columns read as wider datatypes
+    if casts := [pl.col(c).cast(d) for c, d in schema.items() if d != readable[c]]:
+        df = df.with_columns(casts)
+
+    # unpack the object if needed
+    if s.nested:
+        df = df.json.unpack(s.struct)
 
     # rename fields (otherwise renamed to their full json paths)
-    df = df.rename(s.json_paths)
+    if renames := {p: c for p, c in s.json_paths.items() if p != c}:
+        df = df.rename(renames)
 
     # final selection (drop extra/unwanted columns)
     return df.select(s.columns)
@@ -296,34 +377,149 @@ def unpack_text(
     The preferred way for native JSON content remains the `unpack_ndjson()` function
     defined in this same script.
 
-    In the current `Polars` implementation this function is however better suited for
-    the use case: the provided schema is always dominant, regardless of the content of
-    the JSON file. We do not need to add or remove missing or supplementary columns,
-    everything is taken care of by the `json_extract()` method.
+    The provided schema is always dominant, regardless of the content of the JSON file.
+    We do not need to add or remove missing or supplementary columns, everything is
+    taken care of by the `json_extract()` method.
     """
     s = parse_schema(path_schema)
 
     # read as plain text
-    # unpack object and rename fields (otherwise renamed to their full json paths)
-    # no other transformations are necessary as the schema is already dominant here
-    return (
+    df = (
         pl.scan_csv(
             path_data,
             has_header=False,
-            new_columns=["raw"],
+            schema={"raw": pl.Utf8},
             separator=separator,
             **kwargs,
         )
         .select(pl.col("raw").str.json_extract(s.struct))
         .unnest("raw")
-        .json.unpack(s.struct)
-        .rename(s.json_paths)
     )
 
+    # unpack object if needed and rename fields (otherwise renamed to their full json
+    # paths); no other transformations are necessary as the schema is already dominant
+    if s.nested:
+        df = df.json.unpack(s.struct)
+    if renames := {p: c for p, c in s.json_paths.items() if p != c}:
+        df = df.rename(renames)
+
+    return df
+
+
+def _ndjson_dtype(dtype: pl.DataType) -> pl.DataType:
+    """Widen a datatype to one the newline-delimited JSON reader can deserialize to.
+
+    Parameters
+    ----------
+    dtype : polars.DataType
+        Datatype as described in the schema.
+
+    Returns
+    -------
+    : polars.DataType
+        Identical datatype, but for the (nested) narrow integers widened to 64 bits.
+    """
+    if isinstance(dtype, pl.Struct):
+        return pl.Struct(
+            [pl.Field(f.name, _ndjson_dtype(f.dtype)) for f in dtype.fields],
+        )
+    if isinstance(dtype, pl.List):
+        return pl.List(_ndjson_dtype(dtype.inner))
+
+    return _NDJSON_DTYPES.get(dtype, dtype)
+
+
+# keyed on datatype objects only (never on names); a handful of them in practice, but
+# parameterised datatypes (time zones, precisions, etc.) make for an open-ended set
+@functools.lru_cache(maxsize=128)
+def _dtype_name(dtype: pl.DataType) -> str:
+    """Render (and cache) the name of a non-nested `Polars` datatype.
+
+    The same handful of datatypes repeat throughout an inferred schema; each of them
+    is only turned into text once.
+
+    Parameters
+    ----------
+    dtype : polars.DataType
+        Non-nested datatype.
+
+    Returns
+    -------
+    : str
+        Name of the datatype, as printed by `Polars`.
+    """
+    return str(dtype)
+
+
+@functools.lru_cache(maxsize=1024)
+def _field(name: str, dtype: pl.DataType) -> pl.Field:
+    """Build (and cache) a `Polars` `Field`.
+
+    Parameters
+    ----------
+    name : str
+        Field name.
+    dtype : polars.DataType
+        Field datatype, one of the values of `POLARS_DATATYPES` or a (cached) nested
+        datatype.
+
+    Returns
+    -------
+    : polars.Field
+        `Polars` `Field` object, shared between all identical fields.
+    """
+    return pl.Field(name, dtype)
+
+
+@functools.lru_cache(maxsize=1024)
+def _list(inner: pl.DataType) -> pl.List:
+    """Build (and cache) a `Polars` `List`.
+
+    Parameters
+    ----------
+    inner : polars.DataType
+        Datatype of the content of the list.
+
+    Returns
+    -------
+    : polars.List
+        `Polars` `List` object, shared between all identical lists.
+    """
+    return pl.List(inner)
+
+
+@functools.lru_cache(maxsize=1024)
+def _struct(fields: tuple[pl.Field, ...]) -> pl.Struct:
+    """Build (and cache) a `Polars` `Struct`.
+
+    Parameters
+    ----------
+    fields : tuple[polars.Field, ...]
+        Fields of the structure.
+
+    Returns
+    -------
+    : polars.Struct
+        `Polars` `Struct` object, shared between all identical structures.
+    """
+    return pl.Struct(list(fields))
+
 
 class SchemaParser:
     """Parse a plain text JSON schema into a `Polars` `Struct`."""
 
+    __slots__ = (
+        "_columns_set",
+        "columns",
+        "dtypes",
+        "json_paths",
+        "nested",
+        "record",
+        "separator",
+        "source",
+        "struct",
+    )
+
     def __init__(self, source: str = "", separator: str = ".") -> None:
         """Instantiate the object.
 
@@ -344,6 +540,8 @@ class SchemaParser:
             Expected list of datatypes in the final `Polars` `DataFrame` or `LazyFrame`.
         json_paths : dit[str, str]
             Dictionary of JSON path -> column name pairs.
+        nested : bool
+            Whether the schema describes any nested (list or structure) content.
         separator : str
             JSON path separator to use when building the full JSON path.
         source : str
@@ -355,8 +553,10 @@ class SchemaParser:
         self.separator = separator
 
         self.columns: list[str] = []
+        self._columns_set: set[str] = set()
         self.dtypes: list[pl.DataType] = []
         self.json_paths: dict[str, str] = {}
+        self.nested: bool = False
         self.struct: pl.Struct | None = None
 
     def format_error(self, unparsed: str) -> str:
@@ -389,37 +589,63 @@ class SchemaParser:
         # start/end of the issue
         issue_start = self.source.index(unparsed)
         issue_end = (
-            issue_start + m.start()
-            if (m := re.search(r"[()\[\]{}<>\n]", self.source[issue_start:]))
-            is not None
+            m.start()
+            if (m := _RE_ISSUE_END.search(self.source, issue_start)) is not None
             else len(self.source)
         )
 
         # start/end of the line
-        line_start = (
-            issue_start - self.source[:issue_start][::-1].index("\n") + 1
-            if issue_start and "\n" in self.source[:issue_start]
-            else 1
-        )
+        line_start = self.source.rfind("\n", 0, issue_start) + 1
         line_end = (
-            issue_end + self.source[issue_end:].index("\n")
-            if "\n" in self.source[issue_end:]
+            line_end
+            if (line_end := self.source.find("\n", issue_end)) != -1
             else len(self.source)
         )
 
-        # line number at which the issue happens
-        line_number = self.source[:issue_start].count("\n") + 1
+        # lines up to (and including) the one at which the issue happens
+        lines = self.source[:line_end].split("\n")
 
         # captain obvious
-        msg = f"Tripped on line {line_number}\n\n"
-        for i, line in enumerate(self.source[:line_end].split("\n")):
-            msg += f"   {i + 1:-3d} │ {line}\n"
-        msg += "     ? │ "
-        msg += " " * (issue_start - line_start + 1)
-        msg += "^" * (issue_end - issue_start)
-        msg += "\n"
+        return "".join(
+            [
+                f"Tripped on line {len(lines)}\n\n",
+                *(f"   {i:-3d} │ {line}\n" for i, line in enumerate(lines, 1)),
+                "     ? │ ",
+                " " * (issue_start - line_start),
+                "^" * (issue_end - issue_start),
+                "\n",
+            ],
+        )
+
+    def _register_column(self, name: str, column: str, dtype: pl.DataType) -> None:
+        """Register a non-nesting attribute as a column of the final table.
 
-        return msg
+        Parameters
+        ----------
+        name : str
+            Attribute name.
+        column : str
+            Column name (the attribute name, or its new name if renamed).
+        dtype : polars.DataType
+            `Polars` datatype for this attribute.
+
+        Raises
+        ------
+        : DuplicateColumnError
+            When a column is encountered more than once in the schema.
+        """
+        record = self.record
+
+        if column in self._columns_set:
+            raise DuplicateColumnError(self.format_error(column))
+
+        self.columns.append(column)
+        self._columns_set.add(column)
+        self.dtypes.append(dtype)
+
+        # json path and associated column name
+        path = record["path"][-1] if record["path"] else ""
+        self.json_paths[f"{path}{self.separator}{name}" if path else name] = column
 
     def parse_renamed_attr_dtype(
         self,
@@ -453,31 +679,18 @@ class SchemaParser:
         : UnknownDataTypeError
             When an unknown/unsupported datatype is encountered.
         """
-        # sanity check
-        if dtype.lower() not in POLARS_DATATYPES:
-            raise UnknownDataTypeError(self.format_error(dtype))
+        record = self.record
+
+        # sanity check (keeping the original spelling for the error message)
+        dtype, spelling = _DATATYPES_SPELLINGS.get(dtype) or dtype.lower(), dtype
+        if (datatype := POLARS_DATATYPES.get(dtype)) is None:
+            raise UnknownDataTypeError(self.format_error(spelling))
 
-        dtype = dtype.lower()
-        field = pl.Field(name, POLARS_DATATYPES[dtype])
+        field = _field(name, datatype)
 
         # add to the lists
-        if dtype not in ("array", "list", "struct"):
-            if renamed_to not in self.columns:
-                self.columns.append(renamed_to)
-                self.dtypes.append(POLARS_DATATYPES[dtype])
-
-                # json path and associated column name
-                path = (
-                    self.separator.join(self.record["path"])
-                    .replace("[]", "")
-                    .replace(self.separator * 2, self.separator)
-                    .rstrip(self.separator)
-                )
-                self.json_paths[
-                    f"{path}{self.separator}{name}".lstrip(self.separator)
-                ] = renamed_to
-            else:
-                raise DuplicateColumnError(self.format_error(renamed_to))
+        if dtype not in _NESTED_DTYPES:
+            self._register_column(name, renamed_to, datatype)
 
         # renaming part of the json path is not supported (nor needed)
         else:
@@ -485,8 +698,8 @@ class SchemaParser:
 
         # keep track of the nested object encountered, or if non-nested add it to the
         # the current nested object, or the root struct
-        if self.record["parents"]:
-            self.record["structs"][-1].append(field)
+        if record["parents"]:
+            record["structs"][-1].append(field)
         else:
             struct.append(field)
 
@@ -516,42 +729,32 @@ class SchemaParser:
         : UnknownDataTypeError
             When an unknown/unsupported datatype is encountered.
         """
-        # sanity check
-        if dtype.lower() not in POLARS_DATATYPES:
-            raise UnknownDataTypeError(self.format_error(dtype))
+        record = self.record
+
+        # sanity check (keeping the original spelling for the error message)
+        dtype, spelling = _DATATYPES_SPELLINGS.get(dtype) or dtype.lower(), dtype
+        if (datatype := POLARS_DATATYPES.get(dtype)) is None:
+            raise UnknownDataTypeError(self.format_error(spelling))
 
-        dtype = dtype.lower()
-        field = pl.Field(name, POLARS_DATATYPES[dtype])
+        field = _field(name, datatype)
 
         # add to the lists
-        if dtype not in ("array", "list", "struct"):
-            if name not in self.columns:
-                self.columns.append(name)
-                self.dtypes.append(POLARS_DATATYPES[dtype])
-
-                # json path and associated column name
-                path = (
-                    self.separator.join(self.record["path"])
-                    .replace("[]", "")
-                    .replace(self.separator * 2, self.separator)
-                    .rstrip(self.separator)
-                )
-                self.json_paths[
-                    f"{path}{self.separator}{name}".lstrip(self.separator)
-                ] = name
-            else:
-                raise DuplicateColumnError(self.format_error(name))
+        if dtype not in _NESTED_DTYPES:
+            self._register_column(name, name, datatype)
 
-        # add the parent to the current path
+        # add the parent to the current path (kept whole at each level)
         else:
-            self.record["path"].append(name)
+            path = record["path"][-1] if record["path"] else ""
+            record["path"].append(
+                f"{path}{self.separator}{name}" if path else name,
+            )
 
         # keep track of the nested object encountered, or if non-nested add it to the
         # the current nested object, or the root struct
-        if dtype in ("list", "struct"):
-            self.record["parents"].append((name, dtype))
-        elif self.record["parents"]:
-            self.record["structs"][-1].append(field)
+        if dtype in _PARENT_DTYPES:
+            record["parents"].append((name, dtype))
+        elif record["parents"]:
+            record["structs"][-1].append(field)
         else:
             struct.append(field)
 
@@ -577,32 +780,37 @@ class SchemaParser:
         : UnknownDataTypeError
             When an unknown/unsupported datatype is encountered.
         """
-        # sanity check
-        if dtype.lower() not in POLARS_DATATYPES:
-            raise UnknownDataTypeError(self.format_error(dtype))
+        record = self.record
 
-        dtype = dtype.lower()
+        # sanity check (keeping the original spelling for the error message)
+        dtype, spelling = _DATATYPES_SPELLINGS.get(dtype) or dtype.lower(), dtype
+        if (datatype := POLARS_DATATYPES.get(dtype)) is None:
+            raise UnknownDataTypeError(self.format_error(spelling))
 
-        # add to the path
-        if dtype in ("list", "struct"):
-            self.record["path"].append("[]")
+        # add to the path (an anonymous parent does not extend it)
+        if dtype in _PARENT_DTYPES:
+            record["path"].append(
+                record["path"][-1] if record["path"] else "",
+            )
 
         # keep track of the nested object encountered, or if non-nested add it to the
         # the current nested object, or the root struct
-        if dtype in ("list", "struct"):
-            self.record["parents"].append(("", dtype))
-        elif self.record["parents"]:
-            self.record["lists"].append(POLARS_DATATYPES[dtype])
+        if dtype in _PARENT_DTYPES:
+            record["parents"].append(("", dtype))
+        elif record["parents"]:
+            record["lists"].append(datatype)
         else:
-            struct.append(pl.Field("", POLARS_DATATYPES[dtype]))
+            struct.append(_field("", datatype))
 
         return struct
 
     def parse_opening_delimiter(self) -> None:
         """Parse and register the opening of a nested structure."""
+        record = self.record
+
         # create a new list to register new fields
-        if self.record["parents"][-1][1] == "struct":
-            self.record["structs"].append([])
+        if record["parents"][-1][1] == "struct":
+            record["structs"].append([])
 
     def parse_closing_delimiter(self, struct: pl.Struct) -> pl.Struct:
         """Parse and register the closing of a nested structure.
@@ -617,30 +825,32 @@ class SchemaParser:
         : polars.Struct
             Updated `Polars` `Struct` including the latest parsed addition.
         """
-        name, dtype = self.record["parents"].pop()
+        record = self.record
+
+        name, dtype = record["parents"].pop()
 
         # remove a parent from the current path
-        if self.record["path"]:
-            self.record["path"].pop()
+        if record["path"]:
+            record["path"].pop()
 
         # list
         if dtype == "list":
-            f = self.record["lists"].pop()
+            f = record["lists"].pop()
             d = f.dtype if hasattr(f, "dtype") else f
 
             # list within struct or list within list
-            field = pl.Field(name, pl.List(d)) if name else pl.List(d)
+            field = _field(name, _list(d)) if name else _list(d)
 
         # struct
         else:
-            field = pl.Field(name, pl.Struct(self.record["structs"].pop()))
+            field = _field(name, _struct(tuple(record["structs"].pop())))
 
         # add the attribute to the current nested object, or the root struct
-        if self.record["parents"]:
-            if self.record["parents"][-1][1] == "list":
-                self.record["lists"].append(field)
+        if record["parents"]:
+            if record["parents"][-1][1] == "list":
+                record["lists"].append(field)
             else:
-                self.record["structs"][-1].append(field)
+                record["structs"][-1].append(field)
         else:
             struct.append(field)
 
@@ -673,7 +883,8 @@ class SchemaParser:
         ])
         ```
 
-        The following patterns (recognised via regular expressions) are supported:
+        The following patterns (recognised via a single regular expression, the
+        alternatives being tried in this order) are supported:
 
         * `([A-Za-z0-9_]+)\s*=\s*([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+)` for an attribute
           name, an equal sign (`=`), a new name for the attribute, a column (`:`) and a
@@ -690,8 +901,10 @@ class SchemaParser:
         Note attribute names and datatypes must not contain spaces and only include
         alphanumerical or underscore (`_`) characters.
 
-        Indentation and trailing commas are ignored. The source is parsed until the end
-        of the file is reached or a `SchemaParsingError` exception is raised.
+        Indentation and trailing commas are ignored. The source is parsed in a single
+        pass, token after token, until the end of the file is reached or a
+        `SchemaParsingError` exception is raised. The source is parsed only once;
+        subsequent calls return the same `Polars` `Struct`.
 
         Returns
         -------
@@ -703,43 +916,48 @@ class SchemaParser:
         : SchemaParsingError
             When unexpected content is encountered and cannot be parsed.
         """
+        # already parsed
+        if self.struct is not None:
+            return self.struct
+
         s = self.source
+        n = len(s)
+        pos = 0
         struct: list[pl.Datatype] = []
 
+        # bound locally, saving on attribute lookups within the loop below
+        match = _RE_TOKEN.match
+        parse_attr_dtype = self.parse_attr_dtype
+        parse_renamed_attr_dtype = self.parse_renamed_attr_dtype
+        parse_lone_dtype = self.parse_lone_dtype
+        parse_opening_delimiter = self.parse_opening_delimiter
+        parse_closing_delimiter = self.parse_closing_delimiter
+
         # bookkeeping
         self.record: dict = {"lists": [], "parents": [], "path": [], "structs": []}
 
         # continue until everything is parsed
-        while s:
-            if (
-                m := re.match(
-                    r"([A-Za-z0-9_]+)\s*=\s*([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+)",
-                    s,
-                )
-            ) is not None:
-                struct = self.parse_renamed_attr_dtype(
-                    struct,
-                    m.group(1),
-                    m.group(2),
-                    m.group(3),
-                )
-            elif (
-                m := re.match(r"([A-Za-z0-9_]+)\s*:\s*([A-Za-z0-9]+)", s)
-            ) is not None:
-                struct = self.parse_attr_dtype(struct, m.group(1), m.group(2))
-            elif (m := re.match(r"([A-Za-z0-9]+)", s)) is not None:
-                struct = self.parse_lone_dtype(struct, m.group(1))
-            elif (m := re.match(r"[(\[{<]", s)) is not None:
-                self.parse_opening_delimiter()
-            elif (m := re.match(r"[)\]}>]", s)) is not None:
-                struct = self.parse_closing_delimiter(struct)
-            elif (m := re.match(r"[,\n\s]+", s)) is not None:
-                pass
-            else:
-                raise SchemaParsingError(self.format_error(s))
+        while pos < n:
+            if (m := match(s, pos)) is None:
+                raise SchemaParsingError(self.format_error(s[pos:]))
 
-            # clean up the current match
-            s = s.replace(m.group(0), "", 1)
+            # most frequent tokens first
+            token = m.lastgroup
+            if token == "separator":
+                pass
+            elif token == "attr_dtype":
+                struct = parse_attr_dtype(struct, *m.group(6, 7))
+            elif token == "renamed_attr_dtype":
+                struct = parse_renamed_attr_dtype(struct, *m.group(2, 3, 4))
+            elif token == "lone_dtype":
+                struct = parse_lone_dtype(struct, m.group(8))
+            elif token == "opening_delimiter":
+                parse_opening_delimiter()
+            elif token == "closing_delimiter":
+                struct = parse_closing_delimiter(struct)
+
+            # move past the current match
+            pos = m.end()
 
         # clean up in case someone checks the object attributes
         delattr(self, "record")
@@ -747,6 +965,11 @@ class SchemaParser:
         # build the final object
         self.struct = pl.Struct(struct)
 
+        # flag nested schemas once, for flat ones not to go through the unpacking
+        self.nested = any(
+            isinstance(getattr(f, "dtype", f), _NESTED_DTYPE_CLASSES) for f in struct
+        )
+
         return self.struct
 
 
@@ -766,11 +989,12 @@ class UnknownDataTypeError(Exception):
     """When an unknown/unsupported datatype is encountered."""
 
 
-@pl.api.register_dataframe_namespace("json")
 @pl.api.register_lazyframe_namespace("json")
 class UnpackFrame:
     """Register a new `df.json.unpack()` method onto `Polars` objects."""
 
+    __slots__ = ("_df", "separator")
+
     def __init__(self, df: pl.DataFrame | pl.LazyFrame, separator: str = ".") -> None:
         """Instantiate the object.
 
@@ -816,41 +1040,210 @@ class UnpackFrame:
         * Unpacked columns will be renamed as their full respective JSON paths to avoid
           potential identical names.
         """
-        # if we are dealing with a nesting column
-        if column is not None:
-            if dtype in (pl.Array, pl.List):
-                # rename column to json path
-                jp = f"{json_path}{self.separator}{column}".lstrip(self.separator)
-                if column in self._df.columns:
-                    self._df = self._df.rename({column: jp})
-                # unpack
-                self._df = self._df.explode(jp).json.unpack(dtype.inner, jp, jp)
-            elif dtype == pl.Struct:
-                self._df = self._df.unnest(column).json.unpack(dtype, json_path)
-
-        # unpack nested children columns when encountered
-        elif hasattr(dtype, "fields"):
-            for f in dtype.fields:
-                # rename column to json path
-                jp = f"{json_path}{self.separator}{f.name}".lstrip(self.separator)
-                if f.name in self._df.columns:
-                    self._df = self._df.rename({f.name: jp})
-                # unpack
-                if type(f.dtype) in (pl.Array, pl.List):
-                    self._df = self._df.explode(jp).json.unpack(f.dtype.inner, jp, jp)
-                elif type(f.dtype) == pl.Struct:
-                    self._df = self._df.unnest(jp).json.unpack(f.dtype, jp)
+        # resolving the schema of a lazy frame walks its whole plan: do it once and keep
+        # track of the changes from there
+        schema = dict(self._df.schema)
+
+        # rename the top level columns to their json paths; nested columns are renamed
+        # as they are unnested, see the `_unnest()` method
+        # (nothing to do if there is no json path to prefix them with)
+        if (
+            json_path
+            and column is None
+            and (fields := getattr(dtype, "fields", None)) is not None
+        ):
+            if renames := {
+                f.name: f"{json_path}{self.separator}{f.name}"
+                for f in fields
+                if f.name in schema
+            }:
+                self._df = self._df.rename(renames)
+                schema = {renames.get(c, c): d for c, d in schema.items()}
+
+        # walk the schema depth-first without recursing; children are stacked in reverse
+        # order to be processed in the order they are defined
+        stack: list[tuple[pl.DataType | pl.Field, str, str | None]] = [
+            (dtype, json_path, column),
+        ]
+
+        while stack:
+            dtype, json_path, column = stack.pop()
+
+            # if we are dealing with a child list (already named after its json path)
+            if isinstance(dtype, pl.Field):
+                stack.append(self._explode(json_path, dtype.dtype, schema))
+
+            # if we are dealing with a nesting column
+            elif column is not None:
+                if isinstance(dtype, _LIST_DTYPES):
+                    # rename column to json path
+                    jp = f"{json_path}{self.separator}{column}" if json_path else column
+                    if column != jp and column in schema:
+                        self._df = self._df.rename({column: jp})
+                        schema[jp] = schema.pop(column)
+                    # unpack
+                    stack.append(self._explode(jp, dtype, schema))
+                elif isinstance(dtype, pl.Struct):
+                    self._unnest([(column, json_path)], schema)
+                    stack.append((dtype, json_path, None))
+
+            # unpack nested children columns (already named after their json paths);
+            # nothing left to do for flat structures
+            elif (fields := getattr(dtype, "fields", None)) is not None and any(
+                isinstance(f.dtype, _NESTED_DTYPE_CLASSES) for f in fields
+            ):
+                prefix = f"{json_path}{self.separator}" if json_path else ""
+                paths = [(f, f"{prefix}{f.name}") for f in fields]
+                # unnest all children structures at once; exploding lists changes the
+                # number of rows and is done one after the other, in order
+                if structs := [
+                    (jp, jp) for f, jp in paths if isinstance(f.dtype, pl.Struct)
+                ]:
+                    self._unnest(structs, schema)
+                for f, jp in reversed(paths):
+                    if isinstance(f.dtype, _LIST_DTYPES):
+                        stack.append((f, jp, None))
+                    elif isinstance(f.dtype, pl.Struct):
+                        stack.append((f.dtype, jp, None))
 
         return self._df
 
+    def _explode(
+        self,
+        column: str,
+        dtype: pl.DataType,
+        schema: dict[str, pl.DataType],
+    ) -> tuple[pl.DataType, str, str | None]:
+        """Explode a list column, as many times as there are lists directly nested.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column to explode.
+        dtype : polars.DataType
+            Datatype of the column (`polars.Array` or `polars.List`).
+        schema : dict[str, polars.DataType]
+            Current schema of the `DataFrame` (or `LazyFrame`), updated in place.
+
+        Returns
+        -------
+        : tuple[polars.DataType, str, str | None]
+            Datatype of the content of the list, final JSON path of the column, and
+            name of the column if its content still needs to be unpacked (`None` if the
+            list contained structures, already unnested).
+
+        Notes
+        -----
+        * The column is renamed once at the end of the chain of `explode()` calls
+          rather than in between each of them.
+        * A list of structures is unnested straight after being exploded, its fields
+          prefixed with the JSON path of the outermost list.
+        """
+        name = column
+        self._df = self._df.explode(column)
+        exploded = schema.pop(column, None)
+        exploded = getattr(exploded, "inner", exploded)
+
+        while isinstance(dtype := dtype.inner, _LIST_DTYPES):
+            self._df = self._df.explode(column)
+            exploded = getattr(exploded, "inner", exploded)
+            name = f"{name}{self.separator}{name}"
+
+        if exploded is not None:
+            schema[name] = exploded
+
+        if name != column:
+            self._df = self._df.rename({column: name})
+
+        # fields of structures are named after the json path of the list itself, as
+        # described by the schema (the name is only doubled for lists of lists)
+        if isinstance(dtype, pl.Struct):
+            self._unnest([(name, column)], schema)
+            return dtype, column, None
+
+        return dtype, name, name
+
+    def _unnest(
+        self,
+        columns: list[tuple[str, str]],
+        schema: dict[str, pl.DataType],
+    ) -> None:
+        """Unnest structure columns, their fields renamed after their full JSON paths.
+
+        Parameters
+        ----------
+        columns : list[tuple[str, str]]
+            Pairs of names of the columns to unnest and JSON paths of their fields.
+        schema : dict[str, polars.DataType]
+            Current schema of the `DataFrame` (or `LazyFrame`), updated in place.
+
+        Notes
+        -----
+        Renaming the fields _before_ unnesting them is what allows unnesting sibling
+        structures at once: their fields might very well share the same names.
+        """
+        renames: dict[str, list[str]] = {}
+        for c, jp in columns:
+            if isinstance(schema.get(c), pl.Struct):
+                prefix = f"{jp}{self.separator}" if jp else ""
+                renames[c] = [f"{prefix}{f.name}" for f in schema[c].fields]
+
+        self._df = self._df.with_columns(
+            [pl.col(c).struct.rename_fields(n) for c, n in renames.items()],
+        ).unnest([c for c, _ in columns])
+
+        for c, names in renames.items():
+            schema.update(zip(names, (f.dtype for f in schema.pop(c).fields)))
+
+
+@pl.api.register_dataframe_namespace("json")
+class _UnpackDataFrame(UnpackFrame):
+    """Register the `df.json.unpack()` method onto `Polars` `DataFrame` objects."""
+
+    __slots__ = ()
+
+    def unpack(
+        self,
+        dtype: pl.DataType,
+        json_path: str = "",
+        column: str | None = None,
+    ) -> pl.DataFrame:
+        """Unpack JSON content into a `DataFrame` given a schema.
+
+        Parameters
+        ----------
+        dtype : polars.DataType
+            Datatype of the current object (`polars.Array`, `polars.List` or
+            `polars.Struct`).
+        json_path : str
+            Full JSON path (_aka_ breadcrumbs) to the current field.
+        column : str | None
+            Column to apply the unpacking on; defaults to `None`.
+
+        Returns
+        -------
+        : polars.DataFrame
+            Updated [unpacked] `Polars` `DataFrame` object.
+
+        Notes
+        -----
+        The unpacking is planned lazily and collected once, for the whole sequence of
+        `explode()`/`unnest()` calls to go through the query optimiser.
+        """
+        return (
+            UnpackFrame(self._df.lazy(), self.separator)
+            .unpack(dtype, json_path, column)
+            .collect()
+        )
+
 
 if __name__ == "__main__":
     # infer schema from ndjson
     if len(sys.argv[1:]) == 1 and sys.argv[1].endswith("ndjson"):
         sys.stdout.write(f"{infer_schema(sys.argv[1])}\n")
-    # unpack ndjson given a schema; at the end as plain text fits the use case better...
+    # unpack ndjson given a schema
     elif len(sys.argv[1:]) == 2:
-        sys.stdout.write(f"{unpack_text(sys.argv[1], sys.argv[2]).fetch(3)}\n")
+        sys.stdout.write(f"{unpack_ndjson(sys.argv[1], sys.argv[2]).fetch(3)}\n")
     # usage
     else:
         sys.stderr.write(f"Usage: python3.1X {sys.argv[0]} <SCHEMA> <NDJSON>\n")
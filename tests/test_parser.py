@@ -16,15 +16,14 @@ from polars_unpack import (
     parse_schema,
 )
 
-
-@pytest.mark.parametrize(
-    ("text", "struct"),
-    [
-        (text.capitalize(), pl.Struct([pl.Field("", dtype)]))
-        for text, dtype in POLARS_DATATYPES.items()
-        if text not in ("list", "struct")
-    ],
+STANDALONE_DTYPES = tuple(
+    (text.capitalize(), pl.Struct([pl.Field("", dtype)]))
+    for text, dtype in POLARS_DATATYPES.items()
+    if text not in ("list", "struct")
 )
+
+
+@pytest.mark.parametrize(("text", "struct"), STANDALONE_DTYPES)
 def test_datatype(text: str, struct: pl.Struct) -> None:
     """Test all supported standalone non-nesting datatypes and associated shorthands.
 
@@ -139,6 +138,30 @@ def test_list_nested_in_struct() -> None:
     assert SchemaParser("Struct(foo: List(Int8))").to_struct() == struct
 
 
+@pytest.mark.parametrize(
+    ("text", "nested"),
+    [
+        ("foo: Int8, bar: Utf8", False),
+        ("foo: Int8, bar: List(Utf8)", True),
+        ("foo: Int8, bar: Struct(fox: Utf8)", True),
+    ],
+)
+def test_nested_flag(text: str, nested: bool) -> None:
+    """Test the flagging of schemas describing nested content.
+
+    Parameters
+    ----------
+    text : str
+        Schema in plain text.
+    nested : bool
+        Expected flag.
+    """
+    sp = SchemaParser(text)
+    sp.to_struct()
+
+    assert sp.nested is nested
+
+
 def test_pretty_printing() -> None:
     """Test whether an inferred schema is correctly printed."""
     with pathlib.Path("tests/samples/nested-list.schema").open() as f:
@@ -273,9 +296,34 @@ def test_real_life() -> None:
     ```
     """
     dtype = parse_schema("tests/samples/complex.schema").struct
-    df = pl.scan_ndjson("tests/samples/complex.ndjson").collect()
+    schema = pl.scan_ndjson("tests/samples/complex.ndjson").schema
+
+    assert dtype.to_schema() == schema
+
+
+def test_repeated_parsing() -> None:
+    """Test the schema is parsed only once, however many times it is requested."""
+    sp = SchemaParser("foo: Int8, bar: Struct(fox: Int8)")
+
+    assert sp.to_struct() is sp.to_struct()
+    assert sp.columns == ["foo", "fox"]
+
+
+def test_schema_caching(tmp_path: pathlib.Path) -> None:
+    """Test the schema file is parsed again only if modified.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+    """
+    path = tmp_path / "test.schema"
+
+    path.write_text("foo: Int8")
+    assert parse_schema(path) is parse_schema(path)
 
-    assert dtype.to_schema() == df.schema
+    path.write_text("foo: Int8, bar: Int8")
+    assert parse_schema(path).columns == ["foo", "bar"]
 
 
 def test_struct_nested_in_list() -> None:
@@ -1,12 +1,64 @@
 """Assert capabilities of the `DataFrame` / `LazyFrame` flattener."""
 
-import json
+import pathlib
+from collections.abc import Callable
+from types import MappingProxyType
 
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 from polars_unpack import SchemaParser, unpack_ndjson, unpack_text
 
+# datatypes of the columns of the expected real life-like table (read-only)
+COMPLEX_DTYPES: MappingProxyType[str, pl.DataType] = MappingProxyType(
+    {
+        "timestamp": pl.Int64,
+        "source": pl.Utf8,
+        "offset": pl.Int64,
+        "transaction_type": pl.Utf8,
+        "location": pl.Int64,
+        "customer_type": pl.Utf8,
+        "customer_identifier": pl.Utf8,
+        "product": pl.Int64,
+        "product_description": pl.Utf8,
+        "quantity": pl.Int64,
+        "vat_rate": pl.Float64,
+        "line_amount_including_vat": pl.Float64,
+        "line_amount_excluding_vat": pl.Float64,
+        "line_amount_vat": pl.Float64,
+        "line_amount_currency": pl.Utf8,
+        "promotion": pl.Int64,
+        "promotion_description": pl.Utf8,
+        "discount_amount_including_vat": pl.Float64,
+        "discount_amount_excluding_vat": pl.Float64,
+        "discount_amount_vat": pl.Float64,
+        "discount_amount_currency": pl.Utf8,
+        "method": pl.Utf8,
+        "company": pl.Utf8,
+        "transaction_identifier": pl.Int64,
+        "total_amount_including_vat": pl.Float64,
+        "total_amount_excluding_vat": pl.Float64,
+        "total_amount_vat": pl.Float64,
+        "total_amount_currency": pl.Utf8,
+    },
+)
+
+
+@pytest.fixture(scope="session")
+def df_complex() -> pl.DataFrame:
+    """Read the expected real life-like table, once per session.
+
+    Returns
+    -------
+    : polars.DataFrame
+        Content of the `tests/samples/complex.csv` file.
+    """
+    return pl.scan_csv(
+        "tests/samples/complex.csv",
+        schema=dict(COMPLEX_DTYPES),
+    ).collect()
+
 
 def test_datatype() -> None:
     """Test a standalone datatype.
@@ -33,8 +85,7 @@ def test_datatype() -> None:
 
     # tested in the other module but might as well...
     assert SchemaParser("Int64").to_struct() == dtype
-    assert dtype.to_schema() == df.schema
-    assert df.json.unpack(dtype).frame_equal(df)
+    assert_frame_equal(df.json.unpack(dtype), df)
 
 
 def test_list() -> None:
@@ -71,14 +122,13 @@ def test_list() -> None:
     df = pl.DataFrame(
         {
             "text": "foobar",
-            "json": json.loads("[[0, 1, 2, 3]]"),
+            "json": [[0, 1, 2, 3]],
         },
         dtype,
     )
 
     assert SchemaParser("text:Utf8,json:List(Int64)").to_struct() == dtype
-    assert dtype.to_schema() == df.schema
-    assert df.json.unpack(dtype).frame_equal(df.explode("json"))
+    assert_frame_equal(df.lazy().json.unpack(dtype).collect(), df.explode("json"))
 
 
 def test_list_nested_in_list_nested_in_list() -> None:
@@ -138,22 +188,18 @@ def test_list_nested_in_list_nested_in_list() -> None:
     df = pl.DataFrame(
         {
             "text": "foobar",
-            "json": json.loads(
-                "[[[[10, 12], [11, 13]], [[30, 32], [31, 33]]],"
-                " [[[20, 22], [21, 23]], [[40, 42], [41, 43]]]]",
-            ),
+            "json": [
+                [[[10, 12], [11, 13]], [[30, 32], [31, 33]]],
+                [[[20, 22], [21, 23]], [[40, 42], [41, 43]]],
+            ],
         },
         dtype,
     )
 
     assert SchemaParser("text:Utf8,json:List(List(List(Int64)))").to_struct() == dtype
-    assert dtype.to_schema() == df.schema
-    assert (
-        df.json.unpack(dtype)
-        .rename({"json.json.json.json": "json"})
-        .frame_equal(
-            df.explode("json").explode("json").explode("json"),
-        )
+    assert_frame_equal(
+        df.lazy().json.unpack(dtype).collect().rename({"json.json.json.json": "json"}),
+        df.lazy().explode("json").explode("json").explode("json").collect(),
     )
 
 
@@ -215,9 +261,7 @@ def test_list_nested_in_struct() -> None:
         {
             "text": ["foobar"],
             "json": [
-                json.loads(
-                    '{"foo": {"fox": 0, "foz": 2}, "bar": [1, 3]}',
-                ),
+                {"foo": {"fox": 0, "foz": 2}, "bar": [1, 3]},
             ],
         },
         dtype,
@@ -229,27 +273,54 @@ def test_list_nested_in_struct() -> None:
         ).to_struct()
         == dtype
     )
-    assert dtype.to_schema() == df.schema
-    assert df.json.unpack(dtype).frame_equal(
-        df.unnest("json")
+    assert_frame_equal(
+        df.lazy().json.unpack(dtype).collect(),
+        df.lazy()
+        .unnest("json")
         .unnest("foo")
         .explode("bar")
-        .rename({"fox": "json.foo.fox", "foz": "json.foo.foz", "bar": "json.bar"}),
+        .rename({"fox": "json.foo.fox", "foz": "json.foo.foz", "bar": "json.bar"})
+        .collect(),
     )
 
 
-@pytest.mark.parametrize(
-    ("df"),
-    [
-        unpack_ndjson(
-            "tests/samples/complex.schema", "tests/samples/complex.ndjson",
-        ).collect(),
-        unpack_text(
-            "tests/samples/complex.schema", "tests/samples/complex.ndjson",
-        ).collect(),
-    ],
-)
-def test_real_life(df: pl.DataFrame) -> None:
+def test_narrow_integers(tmp_path: pathlib.Path) -> None:
+    """Test the scanning of integers not natively deserialized by the JSON reader.
+
+    Test the following JSON content:
+
+    ```json
+    {"foo": 1, "bar": {"fox": 2}}
+    ```
+
+    as described by the following schema:
+
+    ```
+    foo: Int8,
+    bar: Struct(fox: UInt16)
+    ```
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+    """
+    schema = {"foo": pl.Int8, "fox": pl.UInt16}
+
+    (tmp_path / "test.schema").write_text("foo: Int8, bar: Struct(fox: UInt16)")
+    (tmp_path / "test.ndjson").write_text('{"foo": 1, "bar": {"fox": 2}}\n')
+
+    df = unpack_ndjson(tmp_path / "test.schema", tmp_path / "test.ndjson").collect()
+
+    assert_frame_equal(df, pl.DataFrame({"foo": [1], "fox": [2]}, schema=schema))
+    assert df.schema == schema
+
+
+@pytest.mark.parametrize("unpack", [unpack_ndjson, unpack_text])
+def test_real_life(
+    unpack: Callable[[str, str], pl.LazyFrame],
+    df_complex: pl.DataFrame,
+) -> None:
     """Test complex real life-like parsing and flattening.
 
     Test the following nested JSON content:
@@ -378,45 +449,18 @@ def test_real_life(df: pl.DataFrame) -> None:
 
     Parameters
     ----------
-    df : polars.DataFrame
-        Unpacked `Polars` `DataFrame`.
+    unpack : typing.Callable[[str, str], polars.LazyFrame]
+        Function unpacking the JSON content given a schema.
+    df_complex : polars.DataFrame
+        Expected `Polars` `DataFrame`.
     """
-    df_csv = pl.scan_csv(
-        "tests/samples/complex.csv",
-        dtypes={
-            "timestamp": pl.Int64,
-            "source": pl.Utf8,
-            "offset": pl.Int64,
-            "transaction_type": pl.Utf8,
-            "location": pl.Int64,
-            "customer_type": pl.Utf8,
-            "customer_identifier": pl.Utf8,
-            "product": pl.Int64,
-            "product_description": pl.Utf8,
-            "quantity": pl.Int64,
-            "vat_rate": pl.Float64,
-            "line_amount_including_vat": pl.Float64,
-            "line_amount_excluding_vat": pl.Float64,
-            "line_amount_vat": pl.Float64,
-            "line_amount_currency": pl.Utf8,
-            "promotion": pl.Int64,
-            "promotion_description": pl.Utf8,
-            "discount_amount_including_vat": pl.Float64,
-            "discount_amount_excluding_vat": pl.Float64,
-            "discount_amount_vat": pl.Float64,
-            "discount_amount_currency": pl.Utf8,
-            "method": pl.Utf8,
-            "company": pl.Utf8,
-            "transaction_identifier": pl.Int64,
-            "total_amount_including_vat": pl.Float64,
-            "total_amount_excluding_vat": pl.Float64,
-            "total_amount_vat": pl.Float64,
-            "total_amount_currency": pl.Utf8,
-        },
+    df = unpack(
+        "tests/samples/complex.schema",
+        "tests/samples/complex.ndjson",
     ).collect()
 
-    assert df.dtypes == df_csv.dtypes
-    assert df.frame_equal(df_csv)
+    assert df.dtypes == df_complex.dtypes
+    assert_frame_equal(df, df_complex)
 
 
 def test_rename_fields() -> None:
@@ -474,7 +518,7 @@ def test_rename_fields() -> None:
     df = pl.DataFrame(
         {
             "text": ["foobar"],
-            "json": [json.loads('{"foo": 0, "bar": 1}')],
+            "json": [{"foo": 0, "bar": 1}],
         },
         dtype,
     )
@@ -493,15 +537,14 @@ def test_rename_fields() -> None:
     df_renamed = pl.DataFrame(
         {
             "string": ["foobar"],
-            "json": [json.loads('{"fox": 0, "bax": 1}')],
+            "json": [{"fox": 0, "bax": 1}],
         },
         dtype_renamed,
     )
 
-    assert (
-        df.json.unpack(dtype)
-        .rename(schema.json_paths)
-        .frame_equal(df_renamed.unnest("json"))
+    assert_frame_equal(
+        df.lazy().json.unpack(dtype).collect().rename(schema.json_paths),
+        df_renamed.unnest("json"),
     )
 
 
@@ -543,7 +586,7 @@ def test_struct() -> None:
     df = pl.DataFrame(
         {
             "text": ["foobar"],
-            "json": [json.loads('{"foo": 0, "bar": 1}')],
+            "json": [{"foo": 0, "bar": 1}],
         },
         dtype,
     )
@@ -551,9 +594,12 @@ def test_struct() -> None:
     assert (
         SchemaParser("text:Utf8,json:Struct(foo:Int64,bar:Int64)").to_struct() == dtype
     )
-    assert dtype.to_schema() == df.schema
-    assert df.json.unpack(dtype).frame_equal(
-        df.unnest("json").rename({"foo": "json.foo", "bar": "json.bar"}),
+    assert_frame_equal(
+        df.lazy().json.unpack(dtype).collect(),
+        df.lazy()
+        .unnest("json")
+        .rename({"foo": "json.foo", "bar": "json.bar"})
+        .collect(),
     )
 
 
@@ -605,7 +651,7 @@ def test_struct_nested_in_list() -> None:
     df = pl.DataFrame(
         {
             "text": "foobar",
-            "json": json.loads('[[{"foo": 0, "bar": 1}, {"foo": 2, "bar": 3}]]'),
+            "json": [[{"foo": 0, "bar": 1}, {"foo": 2, "bar": 3}]],
         },
         dtype,
     )
@@ -614,11 +660,125 @@ def test_struct_nested_in_list() -> None:
         SchemaParser("text:Utf8,json:List(Struct(foo:Int64,bar:Int64))").to_struct()
         == dtype
     )
-    assert dtype.to_schema() == df.schema
-    assert df.json.unpack(dtype).frame_equal(
-        df.explode("json")
+    assert_frame_equal(
+        df.lazy().json.unpack(dtype).collect(),
+        df.lazy()
+        .explode("json")
         .unnest("json")
-        .rename({"foo": "json.foo", "bar": "json.bar"}),
+        .rename({"foo": "json.foo", "bar": "json.bar"})
+        .collect(),
+    )
+
+
+def test_struct_nested_in_list_nested_in_list(tmp_path: pathlib.Path) -> None:
+    """Test a `polars.Struct` nested in a `polars.List` nested in a `polars.List`.
+
+    Test the following nested JSON content:
+
+    ```json
+    {
+        "text": "foobar",
+        "json": [
+            [
+                {
+                    "foo": 0,
+                    "bar": 1
+                }
+            ],
+            [
+                {
+                    "foo": 2,
+                    "bar": 3
+                },
+                {
+                    "foo": 4,
+                    "bar": 5
+                }
+            ]
+        ]
+    }
+    ```
+
+    as described by the following schema:
+
+    ```
+    text: Utf8,
+    json: List(
+        List(
+            Struct(
+                foo: Int64,
+                bar: Int64
+            )
+        )
+    )
+    ```
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory provided by `pytest`.
+    """
+    dtype = pl.Struct(
+        [
+            pl.Field("text", pl.Utf8),
+            pl.Field(
+                "json",
+                pl.List(
+                    pl.List(
+                        pl.Struct(
+                            [pl.Field("foo", pl.Int64), pl.Field("bar", pl.Int64)],
+                        ),
+                    ),
+                ),
+            ),
+        ],
+    )
+
+    df = pl.DataFrame(
+        {
+            "text": "foobar",
+            "json": [
+                [
+                    [{"foo": 0, "bar": 1}],
+                    [{"foo": 2, "bar": 3}, {"foo": 4, "bar": 5}],
+                ],
+            ],
+        },
+        dtype,
+    )
+
+    assert (
+        SchemaParser(
+            "text:Utf8,json:List(List(Struct(foo:Int64,bar:Int64)))",
+        ).to_struct()
+        == dtype
+    )
+    assert_frame_equal(
+        df.lazy().json.unpack(dtype).collect(),
+        pl.DataFrame(
+            {
+                "text": ["foobar", "foobar", "foobar"],
+                "json.foo": [0, 2, 4],
+                "json.bar": [1, 3, 5],
+            },
+        ),
+    )
+
+    # fields named after the json paths of the schema, hence renamed
+    (tmp_path / "test.schema").write_text(
+        "text: Utf8, json: List(List(Struct(foo: Int64, bar: Int64)))",
+    )
+    (tmp_path / "test.ndjson").write_text(df.write_ndjson())
+
+    assert_frame_equal(
+        unpack_ndjson(tmp_path / "test.schema", tmp_path / "test.ndjson").collect(),
+        pl.DataFrame(
+            {
+                "text": ["foobar", "foobar", "foobar"],
+                "foo": [0, 2, 4],
+                "bar": [1, 3, 5],
+            },
+        ),
     )
 
 
@@ -689,9 +849,7 @@ def test_struct_nested_in_struct() -> None:
         {
             "text": ["foobar"],
             "json": [
-                json.loads(
-                    '{"foo": {"fox": 0, "foz": 2}, "bar": {"bax": 1, "baz": 3}}',
-                ),
+                {"foo": {"fox": 0, "foz": 2}, "bar": {"bax": 1, "baz": 3}},
             ],
         },
         dtype,
@@ -704,9 +862,10 @@ def test_struct_nested_in_struct() -> None:
         ).to_struct()
         == dtype
     )
-    assert dtype.to_schema() == df.schema
-    assert df.json.unpack(dtype).frame_equal(
-        df.unnest("json")
+    assert_frame_equal(
+        df.lazy().json.unpack(dtype).collect(),
+        df.lazy()
+        .unnest("json")
         .unnest("foo", "bar")
         .rename(
             {
@@ -715,5 +874,110 @@ def test_struct_nested_in_struct() -> None:
                 "bax": "json.bar.bax",
                 "baz": "json.bar.baz",
             },
+        )
+        .collect(),
+    )
+
+
+@pytest.mark.parametrize(
+    ("text", "data"),
+    [
+        ("Int64", [0, 1, 2, 3]),
+        ("text:Utf8,json:List(Int64)", {"text": "foobar", "json": [[0, 1, 2, 3]]}),
+        (
+            "text:Utf8,json:List(List(List(Int64)))",
+            {"text": "foobar", "json": [[[[0, 1], [2, 3]], [[4, 5], [6, 7]]]]},
+        ),
+        (
+            "text:Utf8,json:Struct(foo:Int64,bar:Int64)",
+            {"text": ["foobar"], "json": [{"foo": 0, "bar": 1}]},
+        ),
+        (
+            "text:Utf8,json:List(Struct(foo:Int64,bar:Int64))",
+            {"text": "foobar", "json": [[{"foo": 0, "bar": 1}, {"foo": 2, "bar": 3}]]},
+        ),
+    ],
+)
+def test_struct_schema(text: str, data: list | dict) -> None:
+    """Test that frames built against a parsed `polars.Struct` share its schema.
+
+    Parameters
+    ----------
+    text : str
+        Schema in plain text.
+    data : list | dict
+        JSON content, as parsed by Python.
+    """
+    dtype = SchemaParser(text).to_struct()
+
+    assert pl.DataFrame(data, dtype).schema == dtype.to_schema()
+
+
+def test_struct_siblings_sharing_field_names() -> None:
+    """Test sibling `polars.Struct` sharing field names.
+
+    Test the following nested JSON content:
+
+    ```json
+    {
+        "text": "foobar",
+        "foo": {
+            "fox": 0,
+            "foz": 2
+        },
+        "bar": {
+            "fox": 1,
+            "foz": 3
+        }
+    }
+    ```
+
+    as described by the following schema:
+
+    ```
+    text: Utf8,
+    foo: Struct(
+        fox: Int64,
+        foz: Int64
+    ),
+    bar: Struct(
+        fox: Int64,
+        foz: Int64
+    )
+    ```
+    """
+    dtype = pl.Struct(
+        [
+            pl.Field("text", pl.Utf8),
+            pl.Field(
+                "foo",
+                pl.Struct([pl.Field("fox", pl.Int64), pl.Field("foz", pl.Int64)]),
+            ),
+            pl.Field(
+                "bar",
+                pl.Struct([pl.Field("fox", pl.Int64), pl.Field("foz", pl.Int64)]),
+            ),
+        ],
+    )
+
+    df = pl.DataFrame(
+        {
+            "text": ["foobar"],
+            "foo": [{"fox": 0, "foz": 2}],
+            "bar": [{"fox": 1, "foz": 3}],
+        },
+        dtype,
+    )
+
+    assert_frame_equal(
+        df.lazy().json.unpack(dtype).collect(),
+        pl.DataFrame(
+            {
+                "text": ["foobar"],
+                "foo.fox": [0],
+                "foo.foz": [2],
+                "bar.fox": [1],
+                "bar.foz": [3],
+            },
         ),
     )